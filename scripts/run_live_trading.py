@@ -33,13 +33,14 @@ except ImportError:
 
 # Now vnpy will read the VNPY_HOME environment variable and use the local folder
 import argparse
+import gc
 import json
 import time
 import signal
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import threading
-from queue import Queue
+from concurrent.futures import Future
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent
@@ -48,7 +49,6 @@ sys.path.insert(0, str(project_root))
 # vnpy相关导入
 from vnpy.event import EventEngine
 from vnpy.trader.engine import MainEngine
-from vnpy.trader.ui import MainWindow, create_qapp
 from vnpy.trader.setting import SETTINGS
 from vnpy_ctastrategy import CtaStrategyApp
 from vnpy_ctastrategy.engine import CtaEngine
@@ -117,6 +117,7 @@ class LiveTradingManager:
         
         # 运行状态
         self.is_running = False
+        self.stop_event = threading.Event()
         self.connected_gateways = set()
         self.active_strategies = {}
         
@@ -311,26 +312,43 @@ class LiveTradingManager:
         if strategy_names is None:
             strategy_names = list(strategies_config.keys())
             
+        # 先提交所有策略的初始化（历史数据加载在CTA引擎的后台线程执行），
+        # 再逐个等待完成并启动，避免按策略串行等待
+        init_futures = {}
         for strategy_name in strategy_names:
             if strategy_name not in strategies_config:
                 print(f"警告: 策略配置不存在: {strategy_name}")
                 continue
                 
             try:
-                self._start_single_strategy(strategy_name, strategies_config[strategy_name])
+                init_futures[strategy_name] = self._init_single_strategy(
+                    strategy_name, strategies_config[strategy_name]
+                )
+            except Exception as e:
+                print(f"策略 {strategy_name} 启动失败: {e}")
+                self.exception_handler.handle_exception(e, f"策略启动: {strategy_name}")
+                
+        for strategy_name, init_future in init_futures.items():
+            try:
+                self._start_single_strategy(
+                    strategy_name, strategies_config[strategy_name], init_future
+                )
             except Exception as e:
                 print(f"策略 {strategy_name} 启动失败: {e}")
                 self.exception_handler.handle_exception(e, f"策略启动: {strategy_name}")
                 
         print(f"已启动策略数量: {len(self.active_strategies)}")
         
-    def _start_single_strategy(self, strategy_name: str, strategy_config: Dict[str, Any]):
+    def _init_single_strategy(self, strategy_name: str, strategy_config: Dict[str, Any]) -> Future:
         """
-        启动单个策略
+        添加并提交初始化单个策略
         
         Args:
             strategy_name: 策略名称
             strategy_config: 策略配置
+            
+        Returns:
+            策略初始化任务
         """
         class_name = strategy_config["class_name"]
         vt_symbol = strategy_config["vt_symbol"]
@@ -354,10 +372,30 @@ class LiveTradingManager:
         )
         
         # 初始化策略
-        self.cta_engine.init_strategy(strategy_name)
+        return self.cta_engine.init_strategy(strategy_name)
+        
+    def _start_single_strategy(
+        self,
+        strategy_name: str,
+        strategy_config: Dict[str, Any],
+        init_future: Future
+    ):
+        """
+        等待初始化完成后启动单个策略
+        
+        Args:
+            strategy_name: 策略名称
+            strategy_config: 策略配置
+            init_future: 策略初始化任务
+        """
+        class_name = strategy_config["class_name"]
+        vt_symbol = strategy_config["vt_symbol"]
+        setting = strategy_config["setting"]
         
         # 等待初始化完成
-        time.sleep(2)
+        init_future.result()
+        if not self.cta_engine.strategies[strategy_name].inited:
+            raise RuntimeError(f"策略 {strategy_name} 初始化失败")
         
         # 启动策略
         self.cta_engine.start_strategy(strategy_name)
@@ -380,6 +418,9 @@ class LiveTradingManager:
             return
             
         try:
+            # 仅在启用图形界面时导入Qt相关模块，命令行模式无需加载
+            from vnpy.trader.ui import MainWindow, create_qapp
+            
             # 创建Qt应用
             self.qapp = create_qapp()
             
@@ -413,6 +454,11 @@ class LiveTradingManager:
             if self.use_gui:
                 self.start_gui()
                 
+            # 启动阶段创建的引擎、策略等长生命周期对象移出GC扫描范围，
+            # 减少运行期间的全量回收停顿
+            gc.collect()
+            gc.freeze()
+            
             self.is_running = True
             print("实盘交易系统启动完成")
             
@@ -498,13 +544,13 @@ class LiveTradingManager:
         """
         interval = self.config["monitoring"]["performance_update_interval"]
         
-        while self.is_running:
+        while not self.stop_event.is_set():
             try:
                 self.performance_monitor.update_performance(self.main_engine)
-                time.sleep(interval)
             except Exception as e:
                 self.exception_handler.handle_exception(e, "性能监控")
-                time.sleep(interval)
+            # 等待下一周期，关闭时立即唤醒
+            self.stop_event.wait(interval)
                 
     def _health_check_loop(self):
         """
@@ -512,13 +558,13 @@ class LiveTradingManager:
         """
         interval = self.config["monitoring"]["health_check_interval"]
         
-        while self.is_running:
+        while not self.stop_event.is_set():
             try:
                 self._perform_health_check()
-                time.sleep(interval)
             except Exception as e:
                 self.exception_handler.handle_exception(e, "健康检查")
-                time.sleep(interval)
+            # 等待下一周期，关闭时立即唤醒
+            self.stop_event.wait(interval)
                 
     def _perform_health_check(self):
         """
@@ -595,6 +641,7 @@ class LiveTradingManager:
         print("正在关闭交易系统...")
         
         self.is_running = False
+        self.stop_event.set()
         
         # 停止所有策略
         for strategy_name in list(self.active_strategies.keys()):
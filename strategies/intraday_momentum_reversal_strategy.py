@@ -8,7 +8,8 @@ from vnpy.app.cta_strategy import (
     ArrayManager,
 )
 from vnpy.trader.constant import Interval, Direction, Offset
-from typing import Dict, Any
+from datetime import date
+from typing import Dict, Any, Optional
 import numpy as np
 
 
@@ -52,7 +53,7 @@ class IntradayMomentumReversalStrategy(CtaTemplate):
     open_price: float = 0.0         # Today's open price
     monitoring_long: bool = False   # Long monitoring status
     monitoring_short: bool = False  # Short monitoring status
-    current_date: str = ""          # Current date
+    current_date: Optional[date] = None  # Current date
     
     # Parameter List
     parameters = [
@@ -127,7 +128,7 @@ class IntradayMomentumReversalStrategy(CtaTemplate):
             return
             
         # Check if it is a new trading day
-        current_date = bar.datetime.strftime("%Y-%m-%d")
+        current_date = bar.datetime.date()
         if current_date != self.current_date:
             self.current_date = current_date
             self.open_price = bar.open_price
@@ -180,14 +181,14 @@ class IntradayMomentumReversalStrategy(CtaTemplate):
         if self.pos == 0:  # Only open positions when there is no current position
             # Check long entry signal
             if self.monitoring_long and self.check_long_entry_signal():
-                size = self.calculate_position_size(current_price, "LONG")
+                size = self.calculate_position_size(current_price, Direction.LONG)
                 self.buy(current_price, size)
                 self.monitoring_long = False
                 self.write_log(f"Open long position: Price={current_price}, Size={size}")
                 
             # Check short entry signal
             elif self.monitoring_short and self.check_short_entry_signal():
-                size = self.calculate_position_size(current_price, "SHORT")
+                size = self.calculate_position_size(current_price, Direction.SHORT)
                 self.short(current_price, size)
                 self.monitoring_short = False
                 self.write_log(f"Open short position: Price={current_price}, Size={size}")
@@ -248,14 +249,14 @@ class IntradayMomentumReversalStrategy(CtaTemplate):
                 self.cover(self.am.close[-1], abs(self.pos))
                 self.write_log(f"Closing short position: RSI={self.rsi_value:.2f}, KDJ_J={self.kdj_j:.2f}")
                 
-    def calculate_position_size(self, current_price: float, direction: str) -> int:
+    def calculate_position_size(self, current_price: float, direction: Direction) -> int:
         """
         Calculate position size
         """
         # Get account funds (using a simplified calculation here)
         account_value = 100000  # Assuming account value is 100,000
         
-        if direction == "LONG":
+        if direction == Direction.LONG:
             # Long: Use 30% if price >= open price, 10% if price < open price
             if current_price >= self.open_price:
                 position_ratio = self.position_size_high